@@ -1,13 +1,16 @@
 from types import TracebackType
 from typing import Any
 
-from collections.abc import Generator
-from threading import RLock
+import mmap
+
+from collections import defaultdict
+from pathlib import Path
+from threading import Lock
 from uuid import UUID
 
 from src.core.exceptions import ContextNotFoundError, ContextVersionError
 from src.core.logger import get_logger
-from src.helpers import get_current_timestamp
+from src.helpers import MappedBuffer, get_current_timestamp
 from src.protocols import ContextManagerProtocol
 from src.schemas import ChangeSet, Context, ContextStore, DictDiff, PipelineContextMap, TaskContextMap, VersionHistory
 
@@ -18,10 +21,11 @@ class ContextManager(ContextManagerProtocol):
     """Manages execution contexts for task scheduling system."""
 
     def __init__(self) -> None:
-        self._lock = RLock()
+        self._lock = Lock()
         self._contexts = ContextStore()
         self._task_contexts = TaskContextMap()
         self._pipeline_contexts = PipelineContextMap()
+        self._context_tasks: defaultdict[UUID, set[UUID]] = defaultdict(set)
 
     def __enter__(self) -> "ContextManager":
         """Context manager entry"""
@@ -33,16 +37,13 @@ class ContextManager(ContextManagerProtocol):
         """Context manager exit."""
         logger.info("Exiting context manager")
 
-    def create_context(self, pipeline_id: UUID | None = None) -> Generator[Context, None, None]:
+    def create_context(self, pipeline_id: UUID | None = None) -> Context:
         """
         Create a new context.
 
         Args:
             pipeline_id: Optional UUID of the associated pipeline.
 
-        Yields:
-            None
-
         Returns:
             Newly created Context object.
         """
@@ -52,17 +53,16 @@ class ContextManager(ContextManagerProtocol):
             if pipeline_id:
                 self._pipeline_contexts.pipeline_contexts[pipeline_id] = context.id
                 context.metadata.pipeline_id = str(pipeline_id)
-            yield context.model_copy(deep=True)
+            return context
 
-    def get_context(self, task_id: UUID) -> Context:
+    def get_context(self, task_id: UUID, *, mutable: bool = False) -> Context:
         """
         Retrieve context by task ID.
 
         Args:
             task_id: UUID of the task.
-
-        Yields:
-            None
+            mutable: Return a deep copy safe for independent mutation
+                instead of the stored context.
 
         Returns:
             Associated Context object.
@@ -75,18 +75,16 @@ class ContextManager(ContextManagerProtocol):
             if not context_id or context_id not in self._contexts.contexts:
                 raise ContextNotFoundError(f"Context not found for task {task_id}")
 
-            return self._contexts.contexts[context_id].model_copy(deep=True)
+            context = self._contexts.contexts[context_id]
+            return context.model_copy(deep=True) if mutable else context
 
-    def update_context(self, context: Context) -> Generator[None, None, None]:
+    def update_context(self, context: Context) -> None:
         """
         Update existing context.
 
         Args:
             context: Updated Context object.
 
-        Yields:
-            None
-
         Raises:
             ContextNotFoundError: If context not found.
             ContextVersionError: If version conflict occurs.
@@ -100,18 +98,14 @@ class ContextManager(ContextManagerProtocol):
             self._record_changes(existing, context)
             context.update_version()
             self._contexts.contexts[context.id] = context
-            yield
 
-    def cleanup_context(self, pipeline_id: UUID) -> Generator[None, None, None]:
+    def cleanup_context(self, pipeline_id: UUID) -> None:
         """
         Remove context and associated data by pipeline ID.
 
         Args:
             pipeline_id: UUID of the pipeline.
 
-        Yields:
-            None
-
         Raises:
             ContextNotFoundError: If context not found.
         """
@@ -119,14 +113,18 @@ class ContextManager(ContextManagerProtocol):
             context_id = self._pipeline_contexts.pipeline_contexts.get(pipeline_id)
             if not context_id:
                 raise ContextNotFoundError(f"Context not found for pipeline {pipeline_id}")
-            self._contexts.contexts.pop(context_id, None)
+            context = self._contexts.contexts.pop(context_id, None)
+            if context:
+                for result in context.results.values():
+                    if isinstance(result, mmap.mmap | MappedBuffer):
+                        result.close()
+                    elif isinstance(result, dict) and (content_path := result.get("content_path")):
+                        Path(content_path).unlink(missing_ok=True)
             self._pipeline_contexts.pipeline_contexts.pop(pipeline_id)
-            self._task_contexts.task_contexts = {
-                task_id: ctx_id for task_id, ctx_id in self._task_contexts.task_contexts.items() if ctx_id != context_id
-            }
-            yield
+            for task_id in self._context_tasks.pop(context_id, ()):
+                self._task_contexts.task_contexts.pop(task_id, None)
 
-    def merge_contexts(self, source: Context, target: Context) -> Generator[Context, None, None]:
+    def merge_contexts(self, source: Context, target: Context) -> Context:
         """
         Merge source context into target context.
 
@@ -134,9 +132,6 @@ class ContextManager(ContextManagerProtocol):
             source: Source Context object.
             target: Target Context object.
 
-        Yields:
-            None
-
         Returns:
             Merged Context object.
         """
@@ -150,9 +145,9 @@ class ContextManager(ContextManagerProtocol):
             new_context.metadata.source_version = source.version
             new_context.update_version()
             self._contexts.contexts[new_context.id] = new_context
-            yield new_context.model_copy(deep=True)
+            return new_context
 
-    def associate_task(self, task_id: UUID, context_id: UUID) -> Generator[None, None, None]:
+    def associate_task(self, task_id: UUID, context_id: UUID) -> None:
         """
         Associate task with context.
 
@@ -160,9 +155,6 @@ class ContextManager(ContextManagerProtocol):
             task_id: UUID of the task.
             context_id: UUID of the context.
 
-        Yields:
-            None
-
         Raises:
             ContextNotFoundError: If context not found.
         """
@@ -170,8 +162,10 @@ class ContextManager(ContextManagerProtocol):
             if context_id not in self._contexts.contexts:
                 raise ContextNotFoundError(f"Context {context_id} not found")
             self._task_contexts.task_contexts[task_id] = context_id
-            self._contexts.contexts[context_id].metadata.associated_tasks.append(str(task_id))
-            yield
+            self._context_tasks[context_id].add(task_id)
+            context = self._contexts.contexts[context_id]
+            context.metadata.associated_tasks.append(str(task_id))
+            context.invalidate_metadata_dump()
 
     def _record_changes(self, old_context: Context, new_context: Context) -> None:
         changes = VersionHistory(
@@ -180,10 +174,7 @@ class ContextManager(ContextManagerProtocol):
             changes=ChangeSet(
                 data=self._diff_dicts(old_context.data, new_context.data),
                 results=self._diff_dicts(old_context.results, new_context.results),
-                metadata=self._diff_dicts(
-                    old_context.metadata.model_dump(exclude={"version_history"}),
-                    new_context.metadata.model_dump(exclude={"version_history"}),
-                ),
+                metadata=self._diff_dicts(old_context.metadata_dump(), new_context.metadata_dump()),
             ),
         )
         new_context.metadata.version_history.append(changes)
@@ -191,14 +182,15 @@ class ContextManager(ContextManagerProtocol):
 
     @staticmethod
     def _diff_dicts(old: dict[str, Any], new: dict[str, Any]) -> DictDiff:
-        diff = DictDiff()
-        for key, value in new.items():
-            if key not in old:
-                diff.added[key] = value
-            elif old[key] != value:
-                diff.modified[key] = {"old": old[key], "new": value}
-        diff.removed = {k: v for k, v in old.items() if k not in new}
-        return diff
+        if old is new or old == new:
+            return DictDiff()
+        old_keys = old.keys()
+        new_keys = new.keys()
+        return DictDiff(
+            added={key: new[key] for key in new_keys - old_keys},
+            modified={key: {"old": old[key], "new": new[key]} for key in new_keys & old_keys if old[key] != new[key]},
+            removed={key: old[key] for key in old_keys - new_keys},
+        )
 
     @property
     def contexts(self) -> dict[UUID, Context]:
@@ -1,86 +1,130 @@
 class BaseError(Exception):
     """Base exception class."""
 
+    __slots__ = ()
+
 
 class UnsupportedPythonVersionError(BaseError):
     """Error raised when unsupported python version is detected."""
 
+    __slots__ = ()
+
 
 class StateError(BaseError):
     """Base error for state operations."""
 
+    __slots__ = ()
+
 
 class StateLockError(StateError):
     """Lock operation failed"""
 
+    __slots__ = ()
+
 
 class StateLoadError(StateError):
     """State load operation failed"""
 
+    __slots__ = ()
+
 
 class StateSaveError(StateError):
     """State save operation failed"""
 
+    __slots__ = ()
+
 
 class StateNotFoundError(StateError):
     """State not found"""
 
+    __slots__ = ()
+
 
 class StateFileError(StateError):
     """Error related to state file operations."""
 
+    __slots__ = ()
+
 
 class StateValidationError(StateError):
     """Error related to state validation."""
 
+    __slots__ = ()
+
 
 class ContextError(BaseError):
     """Base error for context operations."""
 
+    __slots__ = ()
+
 
 class ContextNotFoundError(ContextError):
     """Error raised when context is not found."""
 
+    __slots__ = ()
+
 
 class ContextValidationError(ContextError):
     """Error raised when context validation fails."""
 
+    __slots__ = ()
+
 
 class ContextVersionError(ContextError):
     """Error raised when context version conflict occurs."""
 
+    __slots__ = ()
+
 
 class SchedulerError(BaseError):
     """Base exception for scheduler errors."""
 
+    __slots__ = ()
+
 
 class TaskPoolError(BaseError):
     """Base exception for task pool errors."""
 
+    __slots__ = ()
+
 
 class BaseTaskError(BaseError):
     """Base exception for task errors."""
 
+    __slots__ = ()
+
 
 class TaskError(BaseTaskError):
     """Base exception for task errors."""
 
+    __slots__ = ()
+
 
 class TaskCreationError(TaskError):
     """Error raised when task creation fails."""
 
+    __slots__ = ()
+
 
 class TaskMaxRetriesError(TaskError):
     """Error raised when task max retries is exceeded."""
 
+    __slots__ = ()
+
 
 class TaskTypeNotFoundError(TaskError):
     """Error raised when task type is not registered."""
 
+    __slots__ = ()
+
 
 class TaskConfigValidationError(TaskError):
     """Error raised when task configuration is invalid."""
 
+    __slots__ = ()
+
 
 class TaskExecutionError(TaskError):
     """Error raised when task execution fails."""
+
+    __slots__ = ()
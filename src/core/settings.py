@@ -1,16 +1,18 @@
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv(find_dotenv())
+_CWD = Path.cwd()
+_ROOT = _CWD.parent.parent.resolve()
 
 
 class DefaultSettings(BaseSettings):
     """Class to store default project settings."""
 
-    root_path: Path = Path().cwd().parent.parent.resolve()
+    root_path: Path = _ROOT
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -48,18 +50,26 @@ class StateConfig(DefaultSettings):
     """Configuration for state."""
 
     version: int = Field(default=1, ge=1, description="State version")
-    cache_size: int = Field(default=100, ge=1, description="Default cache size")
     save_interval: int = Field(default=60, ge=0, description="Default lock timeout in seconds")
-    file_path: Path = Field(default=Path.cwd() / "test_state", description="State file path")
+    flush_threshold: int = Field(default=100, ge=1, description="Dirty state count that forces a save")
+    wal_max_bytes: int = Field(default=1 << 20, ge=4096, description="WAL size that triggers snapshot compaction")
+    file_path: Path = Field(default=_CWD / "test_state", description="State file path")
 
     model_config = SettingsConfigDict(env_prefix="STATE")
 
 
 class Settings(BaseSettings):
-    py_ver: PythonVersionSettings = PythonVersionSettings()
-    scheduler: SchedulerConfig = SchedulerConfig()
-    pipeline: PipelineConfig = PipelineConfig()
-    state: StateConfig = StateConfig()
+    py_ver: PythonVersionSettings = Field(default_factory=PythonVersionSettings)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    state: StateConfig = Field(default_factory=StateConfig)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Builds the settings singleton, loading .env exactly once."""
+    load_dotenv(find_dotenv())
+    return Settings()
+
+
+settings = get_settings()
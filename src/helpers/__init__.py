@@ -1,5 +1,6 @@
 from src.helpers.check_python_version import requires_python_version
 from src.helpers.get_current_timestamp import get_current_timestamp
 from src.helpers.get_json_data import from_json_file
+from src.helpers.mapped_buffer import MappedBuffer
 
-__all__: list[str] = ["from_json_file", "get_current_timestamp", "requires_python_version"]
+__all__: list[str] = ["MappedBuffer", "from_json_file", "get_current_timestamp", "requires_python_version"]
@@ -1,5 +1,16 @@
+import time
+
 from datetime import UTC, datetime
 
+_cached_ms: int = 0
+_cached_timestamp: datetime = datetime.now(tz=UTC)
+
 
 def get_current_timestamp() -> datetime:
-    return datetime.now(tz=UTC)
+    """Returns the current UTC time, reusing the datetime within a millisecond."""
+    global _cached_ms, _cached_timestamp  # noqa: PLW0603
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _cached_ms:
+        _cached_ms = now_ms
+        _cached_timestamp = datetime.now(tz=UTC)
+    return _cached_timestamp
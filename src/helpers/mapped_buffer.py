@@ -0,0 +1,29 @@
+from typing import Any
+
+import mmap
+
+
+class MappedBuffer:
+    """Read-only view over a memory-mapped file stored in context results.
+
+    The mapping is immutable, so deep copies of a context share the same
+    instance instead of copying (or failing to pickle) the raw mmap object.
+    """
+
+    __slots__ = ("_mapped",)
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self._mapped = mapped
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._mapped)
+
+    def __len__(self) -> int:
+        return len(self._mapped)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "MappedBuffer":
+        return self
+
+    def close(self) -> None:
+        """Close the underlying mapping."""
+        self._mapped.close()
@@ -18,16 +18,16 @@ def main() -> None:
     scheduler = Scheduler(context_manager=context_manager, state_manager=state_manager)
 
     file_config = FileTaskConfig(operation=FileOperation.WRITE, file_path="test_file.txt", content="Hello, world!")
-    file_task = next(registry.create_task(file_config))
+    file_task = registry.create_task(file_config)
 
     http_config = HttpTaskConfig(url="https://catfact.ninja/fact")
-    http_task = next(registry.create_task(http_config))
+    http_task = registry.create_task(http_config)
 
     parent_http_config = HttpTaskConfig(url="https://catfact.ninja/fact")
-    parent_http_task = next(registry.create_task(parent_http_config))
+    parent_http_task = registry.create_task(parent_http_config)
 
     dependent_file_config = FileTaskConfig(operation=FileOperation.READ, file_path="test_file.txt")
-    dependent_file_task = next(registry.create_task(dependent_file_config))
+    dependent_file_task = registry.create_task(dependent_file_config)
 
     with scheduler:
         scheduler.add_task(file_task)
@@ -1,14 +1,15 @@
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 from collections.abc import Generator
 
 from src.schemas import Context, TaskState
 
 
-@runtime_checkable
 class TaskProtocol(Protocol):
     """Protocol defining the interface for all task types."""
 
+    __slots__ = ()
+
     def execute(self, context: Context) -> Generator[None, None, None]:
         """
         Executes the task with given context.
@@ -1,16 +1,13 @@
-from typing import Protocol, runtime_checkable
-
-from collections.abc import Generator
+from typing import Protocol
 
 from src.protocols.task import TaskProtocol
 from src.schemas import TaskConfig
 
 
-@runtime_checkable
 class TaskFactoryProtocol(Protocol):
     """Protocol for task factory implementation."""
 
-    def create_task(self, config: TaskConfig) -> Generator[TaskProtocol, None, None]:
+    def create_task(self, config: TaskConfig) -> TaskProtocol:
         """
         Creates task instance based on configuration.
 
@@ -18,6 +15,6 @@ class TaskFactoryProtocol(Protocol):
             config: Task configuration
 
         Returns:
-            Generator yielding created task instance
+            Created task instance
         """
         ...
@@ -1,9 +1,12 @@
 from types import TracebackType
 
-from collections import deque
+import heapq
+import time
+
+from collections import defaultdict, deque
 from collections.abc import Generator
-from threading import RLock
-from uuid import UUID
+from datetime import datetime
+from itertools import count
 
 from src.core.logger import get_logger
 from src.core.settings import settings
@@ -22,27 +25,64 @@ class Scheduler:
         self._context_manager = context_manager
         self._state_manager = state_manager
         self._config = settings.scheduler
-        self._lock = RLock()
-        self._tasks: deque[BaseTask] = deque(maxlen=self._config.max_concurrent_tasks)
-        self._completed_tasks: set[UUID] = set()
-        self._failed_tasks: set[UUID] = set()
+        self._ready: deque[BaseTask] = deque()
+        self._delayed: list[tuple[datetime, int, BaseTask]] = []
+        self._delay_order = count()
+        self._waiters: defaultdict[bytes, list[BaseTask]] = defaultdict(list)
+        self._remaining: dict[bytes, int] = {}
+        self._completed_tasks: set[bytes] = set()
+        self._failed_tasks: set[bytes] = set()
 
     def add_task(self, task: BaseTask) -> None:
-        """Add task to the scheduler queue."""
-        self._tasks.append(task)
-        context = next(self._context_manager.create_context())
-        next(self._context_manager.associate_task(task.task_id, context.id))
-
-    def _can_execute(self, task: BaseTask) -> bool:
-        """Checks if all dependencies are completed and if start time is in the future."""
-        for dependency in task.dependencies:
-            if dependency in self._failed_tasks:
-                task.set_state(TaskState.FAILED)
-                self._failed_tasks.add(task.task_id)
-                return False
-            if dependency not in self._completed_tasks:
-                return False
-        return not (task.config.start_time and task.config.start_time > get_current_timestamp())
+        """Add task to the scheduler, indexing it by its unmet dependencies."""
+        context = self._context_manager.create_context()
+        self._context_manager.associate_task(task.task_id, context.id)
+
+        dependencies = task.dependency_ids
+        if not self._failed_tasks.isdisjoint(dependencies):
+            self._fail_task(task)
+            return
+
+        pending = dependencies - self._completed_tasks
+        if pending:
+            self._remaining[task.task_id.bytes] = len(pending)
+            for dependency in pending:
+                self._waiters[dependency].append(task)
+        else:
+            self._enqueue(task)
+
+    def _enqueue(self, task: BaseTask) -> None:
+        """Queue unblocked task, parking future-scheduled tasks on the delay heap."""
+        start_time = task.config.start_time
+        if start_time and start_time > get_current_timestamp():
+            heapq.heappush(self._delayed, (start_time, next(self._delay_order), task))
+        else:
+            self._ready.append(task)
+
+    def _fail_task(self, task: BaseTask) -> None:
+        """Mark task as failed, persist the state and cascade the failure to its waiters."""
+        task.set_state(TaskState.FAILED)
+        self._state_manager.update(task.task_id, task.state)
+        self._resolve_failed(task.task_id.bytes)
+
+    def _resolve_completed(self, task_id: bytes) -> None:
+        """Record completion and move unblocked waiters to the ready queue."""
+        self._completed_tasks.add(task_id)
+        for waiter in self._waiters.pop(task_id, ()):
+            waiter_id = waiter.task_id.bytes
+            remaining = self._remaining[waiter_id] - 1
+            if remaining:
+                self._remaining[waiter_id] = remaining
+            else:
+                del self._remaining[waiter_id]
+                self._enqueue(waiter)
+
+    def _resolve_failed(self, task_id: bytes) -> None:
+        """Record failure and cascade it to every waiter blocked on the task."""
+        self._failed_tasks.add(task_id)
+        for waiter in self._waiters.pop(task_id, ()):
+            self._remaining.pop(waiter.task_id.bytes, None)
+            self._fail_task(waiter)
 
     def _process_task(self, task: BaseTask) -> Generator[None, None, None]:
         """Process task execution. Moves task to completed or failed states."""
@@ -50,24 +90,31 @@ class Scheduler:
         yield from task.execute(context)
         match task.state:
             case TaskState.COMPLETED:
-                self._completed_tasks.add(task.task_id)
+                self._resolve_completed(task.task_id.bytes)
             case TaskState.FAILED:
-                self._failed_tasks.add(task.task_id)
+                self._resolve_failed(task.task_id.bytes)
+        self._state_manager.update(task.task_id, task.state)
 
     def run(self) -> Generator[None, None, None]:
-        """Run event loop."""
-        while self._tasks:
-            task = self._tasks.popleft()
-            if self._can_execute(task):
-                yield from self._process_task(task)
-            elif task.state != TaskState.FAILED:
-                self._tasks.append(task)
+        """Run event loop over the ready queue, waking delayed tasks as they come due."""
+        ready = self._ready
+        delayed = self._delayed
+        heappop = heapq.heappop
+        check_interval = self._config.state_check_interval
+        while ready or delayed:
+            now = get_current_timestamp()
+            while delayed and delayed[0][0] <= now:
+                ready.append(heappop(delayed)[2])
+            if not ready:
+                delay = (delayed[0][0] - now).total_seconds()
+                time.sleep(min(max(delay, 0.0), check_interval))
+                continue
+            yield from self._process_task(ready.popleft())
 
     def __enter__(self) -> "Scheduler":
         """Logic when the scheduler starts."""
         logger.info("Starting scheduler.")
-        with self._lock:
-            next(self._state_manager.load())
+        self._state_manager.load()
         logger.info("Loaded state from storage.")
         return self
 
@@ -75,8 +122,7 @@ class Scheduler:
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
     ) -> None:
         """Logic when the scheduler exits."""
-        with self._lock:
-            next(self._state_manager.save())
+        self._state_manager.save()
         logger.info("Saved state to storage.")
         logger.info("Scheduler stopped")
         if exc_val:
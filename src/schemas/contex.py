@@ -3,7 +3,7 @@ from typing import Any
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from src.helpers import get_current_timestamp
 from src.schemas.mixins import CreatedAtMixin, UpdatedAtMixin, UUIDMixin
@@ -65,12 +65,28 @@ class Context(UUIDMixin, CreatedAtMixin, UpdatedAtMixin):
     metadata: ContextMetadata = Field(default_factory=ContextMetadata, description="Context metadata")
     version: int = Field(default=1, ge=1, description="Context version number")
 
-    model_config = ConfigDict(frozen=False, validate_assignment=True)
+    model_config = ConfigDict(frozen=False, validate_assignment=False)
+
+    _metadata_dump_cache: "tuple[int, dict[str, Any]] | None" = PrivateAttr(default=None)
 
     def update_version(self) -> None:
-        """Updates context version and timestamp."""
-        self.version += 1
-        self.updated_at = get_current_timestamp()
+        """Updates context version and timestamp, bypassing Pydantic's descriptor machinery."""
+        fields = self.__dict__
+        fields["version"] += 1
+        fields["updated_at"] = get_current_timestamp()
+        self._metadata_dump_cache = None
+
+    def metadata_dump(self) -> dict[str, Any]:
+        """Returns metadata dump without version history, cached per context version."""
+        cache = self._metadata_dump_cache
+        if cache is None or cache[0] != self.version:
+            cache = (self.version, self.metadata.model_dump(exclude={"version_history"}))
+            self._metadata_dump_cache = cache
+        return cache[1]
+
+    def invalidate_metadata_dump(self) -> None:
+        """Drops the cached metadata dump after an out-of-band metadata mutation."""
+        self._metadata_dump_cache = None
 
 
 class ContextStore(BaseModel):
@@ -1,3 +1,5 @@
+import sys
+
 from enum import IntEnum, StrEnum, auto
 
 
@@ -55,3 +57,13 @@ class MetricType(StrEnum):
     ERROR_COUNT = auto()
     MEMORY_USAGE = auto()
     TASK_COUNT = auto()
+
+
+def _intern_values(enum_cls: type[StrEnum]) -> None:
+    """Interns member values so serialized states compare by identity."""
+    for member in enum_cls:
+        member._value_ = sys.intern(member._value_)
+
+
+for _enum in (TaskState, TaskType, FileOperation, HttpOperation, MetricType):
+    _intern_values(_enum)
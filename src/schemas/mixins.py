@@ -7,7 +7,7 @@ from src.helpers import get_current_timestamp
 
 
 class BaseMixin(BaseModel):
-    model_config = {"json_encoders": {datetime: lambda dt: dt.isoformat()}}
+    """Common base for schema mixins; datetimes serialize to ISO 8601 natively."""
 
 
 class UUIDMixin(BaseMixin):
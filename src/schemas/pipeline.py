@@ -1,4 +1,6 @@
-from pydantic import ConfigDict, Field, computed_field, model_validator
+from functools import cached_property
+
+from pydantic import ConfigDict, Field, computed_field
 
 from src.core.settings import settings
 from src.schemas.mixins import UUIDMixin
@@ -14,14 +16,9 @@ class Pipeline(UUIDMixin):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @computed_field
+    # mypy cannot model computed_field over a property; see pydantic docs on mypy support.
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def task_count(self) -> int:
-        """Returns the total number of tasks in pipeline."""
+        """Returns the total number of tasks in pipeline, computed once."""
         return len(self.tasks)
-
-    @model_validator(mode="after")
-    def validate_tasks(self) -> "Pipeline":
-        """Validates task list is not empty."""
-        if not self.tasks:
-            raise ValueError("Pipeline must contain at least one task")
-        return self
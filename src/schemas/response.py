@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ResponseData(BaseModel):
     status_code: int
     headers: dict[str, str]
     content: str
+    content_path: str | None = None
+
+    model_config = ConfigDict(frozen=True)
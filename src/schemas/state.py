@@ -13,6 +13,8 @@ class TaskStateData(BaseModel):
     state: TaskState
     updated: datetime
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TaskStates(BaseModel):
     """Collection of task states"""
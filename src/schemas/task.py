@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.helpers import get_current_timestamp
 from src.schemas.enums import FileOperation, HttpOperation, TaskPriority, TaskType
@@ -15,6 +15,8 @@ class TaskBase(BaseModel):
 class TaskMetrics(TaskBase, CreatedAtMixin, UpdatedAtMixin):
     """Collection of metrics for task execution monitoring and analysis."""
 
+    model_config = ConfigDict(frozen=False, validate_assignment=False)
+
     execution_time: float = Field(default=0.0, description="Execution time in seconds")
     retry_count: int = Field(default=0, description="Number of retry attempts")
     error_count: int = Field(default=0, description="Number of errors occurred")
@@ -32,12 +34,13 @@ class TaskConfig(TaskBase, UUIDMixin):
     max_retries: int = Field(default=3, ge=0, description="Maximum number of retry attempts")
     start_time: datetime | None = Field(default=None, description="Scheduled start time")
 
-    @model_validator(mode="after")
-    def validate_start_time(self) -> "TaskConfig":
+    @field_validator("start_time")
+    @classmethod
+    def validate_start_time(cls, value: datetime | None) -> datetime | None:
         """Validates that start_time is not in the past."""
-        if self.start_time and self.start_time < get_current_timestamp():
+        if value and value < get_current_timestamp():
             raise ValueError("Start time cannot be in the past")
-        return self
+        return value
 
 
 class FileTaskConfig(TaskConfig):
@@ -47,6 +50,7 @@ class FileTaskConfig(TaskConfig):
     operation: FileOperation = Field(..., description="Type of file operation")
     file_path: str = Field(..., min_length=1, description="Target file path")
     content: str | None = Field(None, description="Content for write operations")
+    source_path: str | None = Field(None, description="Source file to copy for write operations")
 
 
 class HttpTaskConfig(TaskConfig):
@@ -2,12 +2,11 @@ from types import TracebackType
 
 import fcntl
 import os
+import time
 
-from collections.abc import Generator
 from datetime import datetime
-from functools import lru_cache
 from pathlib import Path
-from threading import RLock
+from threading import Lock
 from uuid import UUID
 
 from src.core.exceptions import StateLoadError, StateLockError, StateNotFoundError, StateSaveError
@@ -19,21 +18,31 @@ from src.schemas import StateData, TaskState, TaskStateData, TaskStates
 
 logger = get_logger(__name__)
 
+_STATE_CONFIG = settings.state
+
+_WAL_TOMBSTONE = "-"
+
 
 class FileStateManager(StateManagerProtocol):
     """File-based state manager with thread safety."""
 
     def __init__(self) -> None:
-        self._lock = RLock()
+        self._lock = Lock()
         self._states: TaskStates = TaskStates()
         self._dirty: set[UUID] = set()
-        self._last_save: datetime | None = None
+        self._last_save_mono: float | None = None
 
-        self._state_file = Path(settings.state.file_path)
+        self._state_file = Path(_STATE_CONFIG.file_path)
         self._lock_file = self._state_file.with_suffix(".lock")
+        self._wal_file = self._state_file.with_suffix(".wal")
+        self._temp_file = self._state_file.with_suffix(".tmp")
+        self._state_path_str = str(self._state_file)
+        self._temp_path_str = str(self._temp_file)
         self._state_file.parent.mkdir(exist_ok=True)
+        self._wal_fd = os.open(str(self._wal_file), os.O_APPEND | os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        self._lock_fd = os.open(str(self._lock_file), os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+        self._dir_fd = os.open(str(self._state_file.parent), os.O_DIRECTORY | os.O_CLOEXEC)
 
-        self._get_state = lru_cache(settings.state.cache_size)(self._get_cached_state)
         self._load_initial_state()
 
     def __enter__(self) -> "FileStateManager":
@@ -43,158 +52,203 @@ class FileStateManager(StateManagerProtocol):
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
     ) -> None:
-        """Context manager exit with guaranteed save"""
-        if self._dirty:
-            for _ in self.save():
-                continue
+        """Context manager exit with guaranteed flush"""
+        self.flush()
+        os.close(self._dir_fd)
+        os.close(self._lock_fd)
+        os.close(self._wal_fd)
 
     @staticmethod
     def _validate_version(version: int) -> None:
         """Validate state file version"""
-        if version != settings.state.version:
+        if version != _STATE_CONFIG.version:
             raise StateLoadError(f"Version mismatch: {version}")
 
-    def _get_cached_state(self, task_id: UUID) -> TaskStateData | None:
-        """Get state from cache"""
-        return self._states.items.get(task_id)
-
     def _load_initial_state(self) -> None:
         """Load initial state on startup"""
         try:
-            for _ in self.load():
-                continue
+            self.load()
         except Exception as e:
             logger.exception("Failed to load initial state", exc_info=e)
 
-    @staticmethod
-    def _acquire_lock(file_path: Path) -> int:
-        """Acquire file lock"""
+    def _acquire_lock(self) -> None:
+        """Acquire the file lock on the long-lived lock descriptor"""
         try:
-            fd = os.open(str(file_path), os.O_RDWR | os.O_CREAT)
-            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
         except OSError as e:
             logger.exception("Failed to acquire lock")
             raise StateLockError("Unable to acquire lock") from e
-        else:
-            return fd
 
-    @staticmethod
-    def _release_lock(fd: int) -> None:
-        """Release file lock"""
+    def _release_lock(self) -> None:
+        """Release the file lock, keeping the descriptor open"""
         try:
-            fcntl.flock(fd, fcntl.LOCK_UN)
-            os.close(fd)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
         except OSError as e:
             logger.exception("Failed to release lock")
             raise StateLockError("Unable to release lock") from e
 
     def _write_state_file(self, data: StateData) -> None:
-        """Write state file atomically"""
-        temp_file = self._state_file.with_suffix(".tmp")
+        """Write state file atomically with a single write and fsync"""
+        payload = data.model_dump_json(by_alias=True).encode("utf-8")
         try:
-            temp_file.write_text(data.model_dump_json(indent=2, by_alias=True), encoding="utf-8")
-            temp_file.replace(self._state_file)
+            fd = os.open(self._temp_path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(self._temp_path_str, self._state_path_str)  # noqa: PTH105
+            os.fsync(self._dir_fd)
         except Exception as e:
             logger.exception("Failed to write state file")
+            self._temp_file.unlink(missing_ok=True)
             raise StateSaveError("Unable to write state file") from e
-        finally:
-            temp_file.unlink(missing_ok=True)
 
-    def load(self) -> Generator[None, None, None]:
-        """Load states from file"""
-        if not self._state_file.exists():
-            yield
+    def _replay_wal(self) -> None:
+        """Apply WAL records accumulated since the last snapshot"""
+        if os.fstat(self._wal_fd).st_size == 0:
             return
-
-        fd = None
+        items = self._states.items
+        lines = self._wal_file.read_text(encoding="utf-8").splitlines()
+        for index, line in enumerate(lines):
+            if not line:
+                continue
+            key, _, payload = line.partition("\t")
+            try:
+                task_id = UUID(key)
+                state = None if payload == _WAL_TOMBSTONE else TaskStateData.model_validate_json(payload)
+            except ValueError:
+                if index == len(lines) - 1:
+                    logger.warning("Dropping torn trailing WAL record")
+                    break
+                raise
+            if state is None:
+                items.pop(task_id, None)
+            else:
+                items[task_id] = state
+
+    def _compact(self) -> None:
+        """Fold the in-memory state into a fresh snapshot and truncate the WAL"""
+        data = StateData(version=_STATE_CONFIG.version, updated=get_current_timestamp(), states=self._states)
+        self._write_state_file(data)
+        os.ftruncate(self._wal_fd, 0)
+
+    def load(self) -> None:
+        """Load the snapshot, then replay the WAL on top of it"""
+        locked = False
         try:
-            fd = self._acquire_lock(self._lock_file)
-            data = StateData.model_validate_json(self._state_file.read_text(encoding="utf-8"))
-            self._validate_version(data.version)
-            yield
+            self._acquire_lock()
+            locked = True
+            if self._state_file.exists():
+                data = StateData.model_validate_json(self._state_file.read_text(encoding="utf-8"))
+                self._validate_version(data.version)
 
-            with self._lock:
-                self._states = data.states
-                self._dirty.clear()
-                self._get_state.cache_clear()
+                with self._lock:
+                    self._states = data.states
+                    self._dirty.clear()
+
+            self._replay_wal()
 
         except Exception as e:
             logger.exception("State load failed")
             raise StateLoadError("Failed to load state") from e
         finally:
-            if fd is not None:
-                self._release_lock(fd)
+            if locked:
+                self._release_lock()
 
-    def save(self) -> Generator[None, None, None]:
-        """Save states to file if modified"""
+    def save(self) -> None:
+        """Append dirty states to the WAL, compacting it when it grows too large"""
         if not self._dirty:
-            yield
             return
 
-        fd = None
+        records, dirty_snapshot = self._drain_dirty()
+        locked = False
         try:
-            data = StateData(version=settings.state.version, updated=get_current_timestamp(), states=self._states)
-            fd = self._acquire_lock(self._lock_file)
-            self._write_state_file(data)
-            yield
+            buf = self._encode_wal_records(records)
+            self._acquire_lock()
+            locked = True
+            os.write(self._wal_fd, buf)
+            os.fdatasync(self._wal_fd)
+            self._last_save_mono = time.monotonic()
 
-            with self._lock:
-                self._dirty.clear()
-                self._last_save = data.updated
+            if os.fstat(self._wal_fd).st_size > _STATE_CONFIG.wal_max_bytes:
+                self._compact()
 
         except Exception as e:
             logger.exception("State save failed")
+            with self._lock:
+                self._dirty |= dirty_snapshot
             raise StateSaveError("Failed to save state") from e
         finally:
-            if fd is not None:
-                self._release_lock(fd)
+            if locked:
+                self._release_lock()
 
-    def update(self, task_id: UUID, state: TaskState) -> Generator[None, None, None]:
+    def _drain_dirty(self) -> tuple[list[tuple[UUID, TaskStateData | None]], set[UUID]]:
+        """Snapshot the dirty records and clear the dirty set under the lock"""
+        with self._lock:
+            items = self._states.items
+            records = [(task_id, items.get(task_id)) for task_id in self._dirty]
+            dirty_snapshot = self._dirty.copy()
+            self._dirty.clear()
+        return records, dirty_snapshot
+
+    @staticmethod
+    def _encode_wal_records(records: list[tuple[UUID, TaskStateData | None]]) -> bytes:
+        """Encode dirty records as newline-delimited WAL entries"""
+        buf = bytearray()
+        for task_id, state in records:
+            payload = _WAL_TOMBSTONE if state is None else state.model_dump_json()
+            buf += f"{task_id.hex}\t{payload}\n".encode()
+        return bytes(buf)
+
+    def flush(self) -> None:
+        """Persist pending updates immediately, bypassing the batching policy"""
+        self.save()
+
+    def update(self, task_id: UUID, state: TaskState) -> None:
         """Update task state"""
         with self._lock:
             state_data = TaskStateData(state=state, updated=get_current_timestamp())
             self._states.items[task_id] = state_data
             self._dirty.add(task_id)
-            self._get_state.cache_clear()
         if self._should_save():
-            yield from self.save()
+            self.save()
 
-    def get(self, task_id: UUID) -> Generator[TaskStateData, None, None]:
+    def get(self, task_id: UUID) -> TaskStateData:
         """Get task state"""
-        state = self._get_state(task_id)
+        state = self._states.items.get(task_id)
         if state is None:
             raise StateNotFoundError(f"State not found: {task_id}")
-        yield state
+        return state
 
-    def cleanup(self, before: datetime) -> Generator[None, None, None]:
-        """Remove old states"""
+    def cleanup(self, before: datetime) -> None:
+        """Remove old states, scanning optimistically outside the lock"""
+        candidates = [id_ for id_, state in list(self._states.items.items()) if state.updated < before]
         with self._lock:
-            expired = {id_ for id_, state in self._states.items.items() if state.updated < before}
-            for id_ in expired:
-                del self._states.items[id_]
-            self._dirty.update(expired)
-            self._get_state.cache_clear()
-            yield
+            items = self._states.items
+            for id_ in candidates:
+                state = items.get(id_)
+                if state is not None and state.updated < before:
+                    del items[id_]
+                    self._dirty.add(id_)
 
         if self._dirty:
-            yield from self.save()
+            self.save()
 
     def _should_save(self) -> bool:
         """Check if states should be saved"""
         if not self._dirty:
             return False
-        if self._last_save is None:
+        if len(self._dirty) >= _STATE_CONFIG.flush_threshold or self._last_save_mono is None:
             return True
-        return (get_current_timestamp() - self._last_save).total_seconds() > settings.state.save_interval
+        return time.monotonic() - self._last_save_mono > _STATE_CONFIG.save_interval
 
     @property
     def modified(self) -> set[UUID]:
-        """Get modified task IDs"""
-        with self._lock:
-            return self._dirty
+        """Get a snapshot of modified task IDs; set reads are atomic under the GIL"""
+        return self._dirty.copy()
 
     @property
     def states(self) -> TaskStates:
-        """Get all states"""
-        with self._lock:
-            return self._states
+        """Get all states; writers must hold _lock, readers need no lock"""
+        return self._states
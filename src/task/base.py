@@ -23,11 +23,14 @@ class TaskError(BaseModel):
 class BaseTask(ABC, TaskProtocol):
     """Base implementation of task functionality."""
 
+    __slots__ = ("_config", "_deps_bytes", "_end_time", "_error", "_metrics", "_retry_count", "_start_time", "_state")
+
     DEFAULT_STATE: ClassVar[TaskState] = TaskState.CREATED
 
     def __init__(self, config: TaskConfig) -> None:
         """Initialize base task parameters."""
         self._config: TaskConfig = config
+        self._deps_bytes: frozenset[bytes] = frozenset(dep.bytes for dep in config.dependencies)
         self._state: TaskState = self.DEFAULT_STATE
         self._metrics: TaskMetrics = TaskMetrics()
         self._start_time: datetime | None = None
@@ -50,6 +53,11 @@ class BaseTask(ABC, TaskProtocol):
         """Get task dependencies."""
         return self._config.dependencies
 
+    @property
+    def dependency_ids(self) -> frozenset[bytes]:
+        """Get task dependencies as raw UUID bytes."""
+        return self._deps_bytes
+
     @property
     def metrics(self) -> TaskMetrics:
         """Get task execution metrics."""
@@ -79,22 +87,22 @@ class BaseTask(ABC, TaskProtocol):
         Returns:
             Generator yielding None on each execution step
         """
-        while True:
+        max_retries = self._config.max_retries
+        for attempt in range(max_retries + 1):
             try:
                 self._start_execution()
                 yield from self._do_execute(context)
-                self._complete_execution()
-                break
             except BaseTaskError as e:
-                if self._retry_count < self._config.max_retries:
-                    self._retry_count += 1
+                if attempt < max_retries:
+                    self._retry_count = attempt + 1
                     self._state = TaskState.RETRY_PENDING
                     self._metrics.retry_count = self._retry_count
                     continue
-                else:
-                    self._handle_error(e)
-                    raise TaskMaxRetriesError("Task max retries exceeded") from None
-        yield None
+                self._handle_error(e)
+                raise TaskMaxRetriesError("Task max retries exceeded") from None
+            else:
+                self._complete_execution()
+                return
 
     @abstractmethod
     def _do_execute(self, context: Context) -> Generator[None, None, None]:
@@ -111,28 +119,34 @@ class BaseTask(ABC, TaskProtocol):
 
     def _start_execution(self) -> None:
         """Prepare task for execution."""
-        self._start_time = get_current_timestamp()
+        now = get_current_timestamp()
+        self._start_time = now
         self._state = TaskState.RUNNING
-        self._update_metrics()
+        self._update_metrics(now)
         self._error = None
 
     def _complete_execution(self) -> None:
         """Handle successful task completion."""
-        self._end_time = get_current_timestamp()
+        now = get_current_timestamp()
+        self._end_time = now
         self._state = TaskState.COMPLETED
-        self._update_metrics()
+        self._update_metrics(now)
 
     def _handle_error(self, error: Exception) -> None:
         """Handle task execution error."""
-        self._error = TaskError(message=str(error), timestamp=get_current_timestamp())
-        self._end_time = get_current_timestamp()
+        now = get_current_timestamp()
+        message = str(error)
+        self._error = TaskError(message=message, timestamp=now)
+        self._end_time = now
         self._state = TaskState.FAILED
         self._metrics.error_count += 1
-        self._metrics.last_error = str(error)
-        self._update_metrics()
-
-    def _update_metrics(self) -> None:
-        """Update task metrics."""
-        self._metrics.updated_at = get_current_timestamp()
+        self._metrics.last_error = message
+        self._update_metrics(now)
+
+    def _update_metrics(self, now: datetime | None = None) -> None:
+        """Update task metrics using a single shared timestamp."""
+        if now is None:
+            now = get_current_timestamp()
+        self._metrics.updated_at = now
         if self._start_time:
-            self._metrics.execution_time = (get_current_timestamp() - self._start_time).total_seconds()
+            self._metrics.execution_time = (now - self._start_time).total_seconds()
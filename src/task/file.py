@@ -1,29 +1,58 @@
+from typing import ClassVar, TextIO
+
+import mmap
+import os
+
+from collections import OrderedDict
 from collections.abc import Callable, Generator
 from pathlib import Path
 
 from src.core.exceptions import TaskError
+from src.helpers import MappedBuffer
 from src.schemas.contex import Context
 from src.schemas.enums import FileOperation
 from src.schemas.task import FileTaskConfig
 from src.task.base import BaseTask
 
 type PathStr = str
-type OperationFunc = Callable[[PathStr, Context], Generator[None, None, None]]
+type OperationFunc = Callable[["FileTask", PathStr, Context], Generator[None, None, None]]
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_APPEND_HANDLES: OrderedDict[PathStr, TextIO] = OrderedDict()
+_MAX_APPEND_HANDLES = 64
+
+
+def _get_append_handle(path: PathStr) -> TextIO:
+    """Get a cached append handle for the path, evicting the least recent one past the cap."""
+    handle = _APPEND_HANDLES.get(path)
+    if handle is None:
+        handle = Path(path).open("a", buffering=_WRITE_BUFFER_SIZE)  # noqa: SIM115
+        _APPEND_HANDLES[path] = handle
+        if len(_APPEND_HANDLES) > _MAX_APPEND_HANDLES:
+            _, evicted = _APPEND_HANDLES.popitem(last=False)
+            evicted.close()
+    else:
+        _APPEND_HANDLES.move_to_end(path)
+    return handle
+
+
+def _evict_append_handle(path: PathStr) -> None:
+    """Close and drop the cached append handle so it cannot outlive its inode."""
+    handle = _APPEND_HANDLES.pop(path, None)
+    if handle is not None:
+        handle.close()
 
 
 class FileTask(BaseTask):
     """Implementation of file system operations task."""
 
+    __slots__ = ("_operation_func",)
+
     def __init__(self, config: FileTaskConfig) -> None:
         super().__init__(config)
         self._config: FileTaskConfig = config
-        self._operations: dict[FileOperation, OperationFunc] = {
-            FileOperation.READ: self._read_file,
-            FileOperation.WRITE: self._write_file,
-            FileOperation.APPEND: self._append_file,
-            FileOperation.DELETE: self._delete_file,
-            FileOperation.CREATE: self._create_file,
-        }
+        self._operation_func: OperationFunc | None = self._OPERATIONS.get(config.operation)
 
     def _do_execute(self, context: Context) -> Generator[None, None, None]:
         """
@@ -36,9 +65,9 @@ class FileTask(BaseTask):
         path = self._config.file_path
 
         try:
-            operation_func = self._operations.get(operation)
+            operation_func = self._operation_func
             if operation_func:
-                yield from operation_func(path, context)
+                yield from operation_func(self, path, context)
 
             context.data["file_path"] = path
             context.data["operation"] = operation.value
@@ -49,47 +78,92 @@ class FileTask(BaseTask):
 
     def _read_file(self, path: PathStr, context: Context) -> Generator[None, None, None]:
         try:
-            with Path(path).open() as f:
-                content = f.read()
-                yield
-                context.results[str(self.task_id)] = content
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                try:
+                    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    context.results[str(self.task_id)] = b""
+                    return
+            finally:
+                os.close(fd)
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield
+            context.results[str(self.task_id)] = MappedBuffer(mapped)
         except OSError as e:
             raise TaskError(f"Error reading file: {e}") from e
 
     def _write_file(self, path: PathStr, context: Context) -> Generator[None, None, None]:
         try:
-            yield
-            with Path(path).open("w") as f:
-                f.write(self._config.content or "")
+            _evict_append_handle(path)
+            source_path = self._config.source_path
+            if source_path:
+                self._copy_file(source_path, path)
+            else:
+                with Path(path).open("w", buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.write(self._config.content or "")
             yield
         except OSError as e:
             raise TaskError(f"Error writing file: {e}") from e
 
+    @staticmethod
+    def _copy_file(source_path: PathStr, path: PathStr) -> None:
+        """Copy source to target in kernel space via sendfile."""
+        in_fd = os.open(source_path, os.O_RDONLY)
+        try:
+            out_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                offset = 0
+                remaining = os.fstat(in_fd).st_size
+                while remaining:
+                    # A single call may transfer fewer bytes than requested (~2 GiB cap).
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            finally:
+                os.close(out_fd)
+        finally:
+            os.close(in_fd)
+
     def _append_file(self, path: PathStr, context: Context) -> Generator[None, None, None]:
         try:
-            yield
-            with Path(path).open("a") as f:
-                f.write(self._config.content or "")
+            handle = _get_append_handle(path)
+            handle.write(self._config.content or "")
+            handle.flush()
             yield
         except OSError as e:
             raise TaskError(f"Error appending to file: {e}") from e
 
     def _delete_file(self, path: PathStr, context: Context) -> Generator[None, None, None]:
+        _evict_append_handle(path)
         try:
-            if Path(path).exists():
-                yield
-                Path(path).unlink()
-                yield
+            os.unlink(path)  # noqa: PTH108
+            yield
+        except FileNotFoundError:
+            pass
         except OSError as e:
             raise TaskError(f"Error deleting file: {e}") from e
 
     def _create_file(self, path: PathStr, context: Context) -> Generator[None, None, None]:
         try:
-            if not Path(path).exists():
-                yield
-                with Path(path).open("w") as f:
-                    if self._config.content:
-                        f.write(self._config.content)
-                yield
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                if self._config.content:
+                    os.write(fd, self._config.content.encode("utf-8"))
+            finally:
+                os.close(fd)
+            yield
+        except FileExistsError:
+            pass
         except OSError as e:
             raise TaskError(f"Error creating file: {e}") from e
+
+    _OPERATIONS: ClassVar[dict[FileOperation, OperationFunc]] = {
+        FileOperation.READ: _read_file,
+        FileOperation.WRITE: _write_file,
+        FileOperation.APPEND: _append_file,
+        FileOperation.DELETE: _delete_file,
+        FileOperation.CREATE: _create_file,
+    }
@@ -1,16 +1,30 @@
-from collections.abc import Generator
+import tempfile
+
+from collections.abc import Generator, Iterator
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from src.schemas.contex import Context
 from src.schemas.response import ResponseData
 from src.schemas.task import HttpTaskConfig
 from src.task.base import BaseTask
 
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+_STREAM_THRESHOLD = 1 << 20
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class HttpTask(BaseTask):
     """Implementation of HTTP request task."""
 
+    __slots__ = ()
+
     def __init__(self, config: HttpTaskConfig) -> None:
         """
         Initialize HTTP task.
@@ -28,37 +42,70 @@ class HttpTask(BaseTask):
         Args:
             context: Task execution context
         """
-        yield
-
-        with requests.Session() as session:
+        response = None
+        try:
+            response = self._make_request(_SESSION)
             yield
 
-            try:
-                response = self._make_request(session)
-                yield
-
-                response.raise_for_status()
-                yield
-
-                self._store_results(context, response)
+            response.raise_for_status()
+            yield
 
-            except requests.RequestException as e:
-                context.data["error"] = str(e)
-                raise
+            self._store_results(context, response)
 
-        yield  # Final yield after session is closed
+        except requests.RequestException as e:
+            if response is not None:
+                response.close()
+            context.data["error"] = str(e)
+            raise
 
     def _make_request(self, session: requests.Session) -> requests.Response:
         """Make the HTTP request."""
         return session.request(
-            method=self._config.method, url=self._config.url, headers=self._config.headers, timeout=self._config.timeout
+            method=self._config.method,
+            url=self._config.url,
+            headers=self._config.headers,
+            timeout=self._config.timeout,
+            stream=True,
         )
 
     def _store_results(self, context: Context, response: requests.Response) -> None:
-        """Store the results of the HTTP request in the context."""
+        """Store the results of the HTTP request, spilling large bodies to disk."""
+        headers = dict(response.headers)
+        try:
+            length = int(headers["Content-Length"])
+        except (KeyError, ValueError):
+            # Missing or malformed header: treat the size as unknown and stream.
+            length = None
+        if length is not None and length <= _STREAM_THRESHOLD:
+            content, content_path = response.text, None
+        else:
+            content, content_path = self._drain_body(response)
+
         context.results[str(self.task_id)] = ResponseData(
-            status_code=response.status_code, headers=dict(response.headers), content=response.text
+            status_code=response.status_code, headers=headers, content=content, content_path=content_path
         ).model_dump()
 
         context.data["url"] = self._config.url
         context.data["method"] = self._config.method
+
+    @staticmethod
+    def _drain_body(response: requests.Response) -> tuple[str, str | None]:
+        """Stream a body of large or unknown size, spilling to disk past the threshold."""
+        stream = iter(response.iter_content(_STREAM_CHUNK_SIZE))
+        chunks: list[bytes] = []
+        size = 0
+        for chunk in stream:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > _STREAM_THRESHOLD:
+                return "", HttpTask._spill_body(chunks, stream)
+        return b"".join(chunks).decode(response.encoding or "utf-8", errors="replace"), None
+
+    @staticmethod
+    def _spill_body(chunks: list[bytes], stream: Iterator[bytes]) -> str:
+        """Write already-buffered chunks and the rest of the body to a temp file."""
+        with tempfile.NamedTemporaryFile(delete=False, prefix="http_task_") as spill:
+            spill.writelines(chunks)
+            for chunk in stream:
+                spill.write(chunk)
+            return spill.name
@@ -32,16 +32,14 @@ def mock_get_current_timestamp(mocker: MockerFixture):
 class TestContextManager:
     def test_create_context(self, context_manager: ContextManager):
         """Test creating a new context."""
-        for _ in context_manager.create_context():
-            continue
+        context_manager.create_context()
         assert isinstance(context_manager, ContextManager), "Context is not an instance of Context"
         assert len(context_manager._contexts.contexts) == 1, "Context was not created"
 
     def test_create_context_with_pipeline_id(self, context_manager: ContextManager):
         """Test creating a new context with pipeline ID."""
         pipeline_id = uuid4()
-        for _ in context_manager.create_context(pipeline_id):
-            continue
+        context_manager.create_context(pipeline_id)
         assert pipeline_id in [
             ctx.pipeline_id for _, ctx in context_manager._contexts.contexts.items()
         ], "Pipeline ID not set"
@@ -71,8 +69,7 @@ class TestContextManager:
         updated_context.data["new_key"] = "new_value"
         updated_context.update_version()
 
-        for _ in context_manager.update_context(updated_context):
-            continue
+        context_manager.update_context(updated_context)
 
         assert context_manager._contexts.contexts[context.id].data["new_key"] == "new_value", "Data not updated"
         assert context_manager._contexts.contexts[context.id].version == updated_context.version, "Version not updated"
@@ -87,7 +84,7 @@ class TestContextManager:
         with pytest.raises(
             ContextVersionError, match=f"Version conflict. Current: {context.version}, Provided: {context.version}"
         ):
-            next(context_manager.update_context(context))
+            context_manager.update_context(context)
 
     def test_cleanup_context(self, context_manager: ContextManager):
         """Test removing a context and associated data."""
@@ -97,29 +94,41 @@ class TestContextManager:
 
         context_manager._pipeline_contexts.pipeline_contexts[pipeline_id] = context.id
         context_manager._contexts.contexts[context.id] = context
-        context_manager._task_contexts.task_contexts[task_id] = context.id
+        context_manager.associate_task(task_id, context.id)
 
-        for _ in context_manager.cleanup_context(pipeline_id):
-            continue
+        context_manager.cleanup_context(pipeline_id)
 
         assert pipeline_id not in context_manager._pipeline_contexts.pipeline_contexts
         assert context.id not in context_manager._contexts.contexts
         assert task_id not in context_manager._task_contexts.task_contexts
 
+    def test_cleanup_context_removes_spilled_bodies(self, context_manager: ContextManager, tmp_path):
+        """Test that cleanup deletes temp files holding spilled response bodies."""
+        spill_file = tmp_path / "http_task_spill"
+        spill_file.write_bytes(b"body")
+
+        pipeline_id = uuid4()
+        context = ContextFactory.build(results={"response": {"content_path": str(spill_file)}})
+        context_manager._pipeline_contexts.pipeline_contexts[pipeline_id] = context.id
+        context_manager._contexts.contexts[context.id] = context
+
+        context_manager.cleanup_context(pipeline_id)
+
+        assert not spill_file.exists(), "Spilled body file should be deleted with the context"
+
     def test_cleanup_context_not_found(self, context_manager: ContextManager):
         """Test cleaning up a non-existent context."""
         pipeline_id = uuid4()
 
         with pytest.raises(ContextNotFoundError, match=f"Context not found for pipeline {pipeline_id}"):
-            next(context_manager.cleanup_context(pipeline_id))
+            context_manager.cleanup_context(pipeline_id)
 
     def test_merge_contexts(self, context_manager: ContextManager, mock_get_current_timestamp):
         """Test merging two contexts."""
         source = ContextFactory.build(data={"key1": "value1"}, results={"result1": "res1"})
         target = ContextFactory.build(data={"key2": "value2"}, results={"result2": "res2"})
 
-        for _ in context_manager.merge_contexts(source, target):
-            continue
+        context_manager.merge_contexts(source, target)
 
         merged = context_manager._contexts.contexts[target.id]
         assert merged.data == {"key1": "value1", "key2": "value2"}, "Data not merged"
@@ -129,14 +138,33 @@ class TestContextManager:
         assert merged.version == target.version + 1, "Version not incremented"
         assert merged.updated_at != target.updated_at, "Timestamp not updated"
 
+    def test_merge_contexts_with_mapped_result(self, context_manager: ContextManager, tmp_path):
+        """Test that mmap-backed read results survive the deep copy on merge."""
+        import mmap
+
+        from src.helpers import MappedBuffer
+
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"mapped content")
+        with test_file.open("rb") as f:
+            buffer = MappedBuffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        source = ContextFactory.build(data={}, results={"read": buffer})
+        target = ContextFactory.build(data={}, results={})
+
+        merged = context_manager.merge_contexts(source, target)
+
+        assert merged.results["read"] is buffer, "Deep copy should share the immutable mapping"
+        assert bytes(merged.results["read"]) == b"mapped content", "Mapped content does not match"
+        buffer.close()
+
     def test_associate_task(self, context_manager: ContextManager):
         """Test associating a task with a context."""
         task_id = uuid4()
         context = ContextFactory.build()
         context_manager._contexts.contexts[context.id] = context
 
-        for _ in context_manager.associate_task(task_id, context.id):
-            continue
+        context_manager.associate_task(task_id, context.id)
 
         assert context_manager._task_contexts.task_contexts[task_id] == context.id, "Task not associated"
         assert (
@@ -148,4 +176,4 @@ class TestContextManager:
         task_id = uuid4()
         contest_id = uuid4()
         with pytest.raises(ContextNotFoundError, match=f"Context {contest_id} not found"):
-            next(context_manager.associate_task(task_id, contest_id))
+            context_manager.associate_task(task_id, contest_id)
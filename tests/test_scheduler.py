@@ -43,36 +43,44 @@ class FBaseTask(BaseTask):
 
 class TestScheduler:
     def test_add_task(self, scheduler, mocker: MockerFixture):
-        config = BaseTaskFactory.build()
+        config = BaseTaskFactory.build(dependencies=[])
         task = FBaseTask(config)
 
         mock_context = mocker.Mock()
-        scheduler._context_manager.create_context.return_value = iter([mock_context])
-        scheduler._context_manager.associate_task.return_value = iter([None])
+        scheduler._context_manager.create_context.return_value = mock_context
 
         scheduler.add_task(task)
 
-        assert len(scheduler._tasks) == 1, "Task was not added to the queue"
-        assert scheduler._tasks[0] == task, "Added task is not at the front of the queue"
+        assert len(scheduler._ready) == 1, "Task was not added to the ready queue"
+        assert scheduler._ready[0] == task, "Added task is not at the front of the ready queue"
 
-    def test_can_execute_start_time_not_reached(self, scheduler, mocker: MockerFixture):
+    def test_add_task_start_time_not_reached(self, scheduler, mocker: MockerFixture):
         future_time = get_current_timestamp() + timedelta(hours=1)
-        config = BaseTaskFactory.build(start_time=future_time.timestamp())
+        config = BaseTaskFactory.build(start_time=future_time, dependencies=[])
         task = FBaseTask(config)
 
-        mocker.patch("src.helpers.get_current_timestamp", return_value=get_current_timestamp().timestamp())
+        mock_context = mocker.Mock()
+        scheduler._context_manager.create_context.return_value = mock_context
+
+        scheduler.add_task(task)
 
-        assert not scheduler._can_execute(task), "Task should not be executable before start time"
+        assert not scheduler._ready, "Task should not be ready before start time"
+        assert scheduler._delayed[0][2] == task, "Task should be parked on the delay heap"
 
-    def test_can_execute_dependencies_completed(self, scheduler):
+    def test_add_task_dependencies_completed(self, scheduler, mocker: MockerFixture):
         dependency = uuid4()
-        config = BaseTaskFactory.build(dependencies=[dependency])
+        config = BaseTaskFactory.build(dependencies=[dependency], start_time=None)
         task = FBaseTask(config)
-        scheduler._completed_tasks.add(dependency)
+        scheduler._completed_tasks.add(dependency.bytes)
+
+        mock_context = mocker.Mock()
+        scheduler._context_manager.create_context.return_value = mock_context
+
+        scheduler.add_task(task)
 
-        assert scheduler._can_execute(task), "Task should be executable if all dependencies are completed"
+        assert scheduler._ready[0] == task, "Task should be ready if all dependencies are completed"
 
-    def test_can_execute_dependencies_failed(self, scheduler, mocker: MockerFixture):
+    def test_add_task_dependencies_failed(self, scheduler, mocker: MockerFixture):
         from datetime import datetime, timedelta
         from zoneinfo import ZoneInfo
 
@@ -81,17 +89,16 @@ class TestScheduler:
         dependency = uuid4()
         config = BaseTaskFactory.build(dependencies=[dependency], start_time=future_time)
         task = FBaseTask(config)
-        scheduler._failed_tasks.add(dependency)
+        scheduler._failed_tasks.add(dependency.bytes)
 
         mock_context = mocker.Mock()
-        scheduler._context_manager.create_context.return_value = iter([mock_context])
-        scheduler._context_manager.associate_task.return_value = iter([None])
+        scheduler._context_manager.create_context.return_value = mock_context
 
         scheduler.add_task(task)
         list(scheduler.run())
 
-        assert task.task_id in scheduler._failed_tasks, "Task should be added to failed tasks"
-        assert task not in scheduler._tasks, "Task should be removed from the queue"
+        assert task.task_id.bytes in scheduler._failed_tasks, "Task should be added to failed tasks"
+        assert task not in scheduler._ready, "Task should not reach the ready queue"
         assert task.state == TaskState.FAILED, "Task state should be set to FAILED"
 
     def test_run(self, scheduler, mocker: MockerFixture):
@@ -99,19 +106,18 @@ class TestScheduler:
         task1 = FBaseTask(config1)
         config2 = BaseTaskFactory.build(start_time=None, dependencies=[task1.task_id])
         task2 = FBaseTask(config2)
-        scheduler._tasks.extend([task1, task2])
+        scheduler._ready.extend([task1, task2])
 
-        mocker.patch.object(scheduler, "_can_execute", side_effect=[True, False, True])
         mocker.patch.object(scheduler, "_process_task", return_value=iter([None]))
 
         list(scheduler.run())
 
-        assert len(scheduler._tasks) == 0, "Tasks should be removed from the queue"
+        assert len(scheduler._ready) == 0, "Tasks should be removed from the queue"
         assert scheduler._process_task.call_count == 2, "Task should be processed twice"
 
     def test_context_manager(self, scheduler, mocker: MockerFixture):
-        mock_load = mocker.patch.object(scheduler._state_manager, "load", return_value=iter([None]))
-        mock_save = mocker.patch.object(scheduler._state_manager, "save", return_value=iter([None]))
+        mock_load = mocker.patch.object(scheduler._state_manager, "load")
+        mock_save = mocker.patch.object(scheduler._state_manager, "save")
 
         with scheduler:
             pass
@@ -1,5 +1,6 @@
+import time
+
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -45,7 +46,7 @@ class TestFileStateManager:
             state_manager._states, dict
         ), "States should be of type TaskStates or dict"
         assert isinstance(state_manager._dirty, set), "Dirty should be of type set"
-        assert state_manager._last_save is None, "Last save should be None"
+        assert state_manager._last_save_mono is None, "Last save should be None"
 
     def test_context_manager(self, state_manager, mocker):
         mock_save = mocker.patch.object(state_manager, "save")
@@ -61,26 +62,25 @@ class TestFileStateManager:
             state_manager._validate_version(999)
 
     def test_update_state(self, state_manager, mock_timestamp, mocker):
+        mocker.patch.object(state_manager, "save")
         task_id = uuid4()
         state = TaskState.RETRY_PENDING
 
-        for _ in state_manager.update(task_id, state):
-            continue
+        state_manager.update(task_id, state)
 
         assert state_manager.states.items[task_id].state == state, "State should be updated"
-        assert state_manager._get_state.cache_info().currsize == 0, "Cache should be cleared"
 
     def test_get_state(self, state_manager):
         task_id = uuid4()
         state_data = TaskStateDataFactory.build()
         state_manager._states.items[task_id] = state_data
 
-        result = next(state_manager.get(task_id))
+        result = state_manager.get(task_id)
         assert result == state_data
 
     def test_get_state_not_found(self, state_manager):
         with pytest.raises(StateNotFoundError):
-            next(state_manager.get(uuid4()))
+            state_manager.get(uuid4())
 
     def test_cleanup(self, state_manager, mock_timestamp, mocker):
         save_mock = mocker.patch.object(state_manager, "save")
@@ -93,47 +93,87 @@ class TestFileStateManager:
         state_manager._states.items[new_task_id] = TaskStateData(state=TaskState.PENDING, updated=datetime.now(tz=UTC))
 
         cleanup_before = datetime.now(tz=UTC) - timedelta(days=1)
-        for _ in state_manager.cleanup(cleanup_before):
-            continue
+        state_manager.cleanup(cleanup_before)
 
         assert old_task_id not in state_manager.states.items, "Old task should be removed"
         assert new_task_id in state_manager.states.items, "New task should not be removed"
         save_mock.assert_called_once()
 
     def test_acquire_lock(self, state_manager, mocker):
-        mock_open = mocker.patch("os.open", return_value=999)
         mock_flock = mocker.patch("fcntl.flock")
 
-        fd = state_manager._acquire_lock(Path("/tmp/test_acquire.lock"))
-        assert fd == 999, "File descriptor should be returned"
+        state_manager._acquire_lock()
         mock_flock.assert_called_once()
 
     def test_acquire_lock_error(self, state_manager, mocker):
-        mocker.patch("os.open", side_effect=OSError)
+        mocker.patch("fcntl.flock", side_effect=OSError)
 
         with pytest.raises(StateLockError):
-            state_manager._acquire_lock(Path("/tmp/test.lock"))
+            state_manager._acquire_lock()
 
     def test_save_state(self, state_manager, mocker):
-        mock_write = mocker.patch("pathlib.Path.write_text")
-        mock_replace = mocker.patch("pathlib.Path.replace")
+        mock_write = mocker.patch("os.write")
+        mocker.patch("os.fdatasync")
+        mocker.patch("os.fstat", return_value=mocker.Mock(st_size=0))
 
         state_manager._dirty.add(uuid4())
 
-        for _ in state_manager.save():
-            continue
+        state_manager.save()
 
-        assert mock_write.called, "File should be written"
-        assert mock_replace.called, "File should be replaced"
+        assert mock_write.called, "WAL should be written"
         assert not state_manager._dirty, "Dirty set should be cleared"
 
+    def test_save_state_compacts_large_wal(self, state_manager, mocker):
+        mocker.patch("os.write")
+        mocker.patch("os.fdatasync")
+        mocker.patch("os.fstat", return_value=mocker.Mock(st_size=10**9))
+        mock_truncate = mocker.patch("os.ftruncate")
+        mock_snapshot = mocker.patch.object(state_manager, "_write_state_file")
+
+        state_manager._dirty.add(uuid4())
+
+        state_manager.save()
+
+        mock_snapshot.assert_called_once(), "Snapshot should be written on compaction"
+        mock_truncate.assert_called_once(), "WAL should be truncated after compaction"
+
+    def test_wal_replay(self, state_manager, mocker):
+        kept_id = uuid4()
+        removed_id = uuid4()
+        kept_state = TaskStateData(state=TaskState.COMPLETED, updated=datetime.now(tz=UTC))
+        wal = (
+            f"{kept_id.hex}\t{kept_state.model_dump_json()}\n"
+            f"{removed_id.hex}\t{kept_state.model_dump_json()}\n"
+            f"{removed_id.hex}\t-\n"
+        )
+        mocker.patch("os.fstat", return_value=mocker.Mock(st_size=len(wal)))
+        mocker.patch("pathlib.Path.read_text", return_value=wal)
+
+        state_manager._replay_wal()
+
+        assert state_manager.states.items[kept_id] == kept_state, "WAL record should be applied"
+        assert removed_id not in state_manager.states.items, "Tombstone should drop the state"
+
+    def test_wal_replay_tolerates_torn_tail(self, state_manager, mocker):
+        kept_id = uuid4()
+        kept_state = TaskStateData(state=TaskState.COMPLETED, updated=datetime.now(tz=UTC))
+        wal = f'{kept_id.hex}\t{kept_state.model_dump_json()}\n{uuid4().hex}\t{{"state": "comp'
+        mocker.patch("os.fstat", return_value=mocker.Mock(st_size=len(wal)))
+        mocker.patch("pathlib.Path.read_text", return_value=wal)
+        state_manager._states.items.clear()
+
+        state_manager._replay_wal()
+
+        assert state_manager.states.items[kept_id] == kept_state, "Intact records should still be applied"
+        assert len(state_manager.states.items) == 1, "Torn trailing record should be dropped"
+
     def test_load_state(self, state_manager, mocker):
         test_data = StateDataFactory.build()
         test_data.version = 1
         mocker.patch("pathlib.Path.read_text", return_value=test_data.model_dump_json())
+        mocker.patch("os.fstat", return_value=mocker.Mock(st_size=0))
 
-        for _ in state_manager.load():
-            continue
+        state_manager.load()
 
         assert state_manager.states == test_data.states
 
@@ -143,5 +183,11 @@ class TestFileStateManager:
         state_manager._dirty.add(uuid4()), "Dirty set should not be empty"
         assert state_manager._should_save(), "Should save if dirty set is not empty"
 
-        state_manager._last_save = datetime.now(tz=UTC) - timedelta(seconds=61)
+        state_manager._last_save_mono = time.monotonic() - 61
         assert state_manager._should_save(), "Should save if last save is older than 60 seconds"
+
+        state_manager._last_save_mono = time.monotonic()
+        assert not state_manager._should_save(), "Should not save right after a save"
+
+        state_manager._dirty.update(uuid4() for _ in range(100))
+        assert state_manager._should_save(), "Should save once dirty count hits the flush threshold"
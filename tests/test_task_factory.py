@@ -10,7 +10,7 @@ from pytest_mock import MockerFixture
 from src.core.exceptions import BaseTaskError, TaskError, TaskMaxRetriesError, TaskTypeNotFoundError
 from src.schemas import Context, FileOperation, FileTaskConfig, HttpTaskConfig, TaskConfig, TaskState, TaskType
 from src.task import BaseTask, FileTask, HttpTask
-from src.task.factory import TaskImplementation, TaskRegistry
+from src.task.factory import TaskRegistry
 
 
 class BaseFactory:
@@ -34,13 +34,13 @@ def task_registry():
 class TestTaskRegistry:
     def test_create_http_task(self, task_registry):
         config = HttpTaskConfigFactory.build(task_type=TaskType.HTTP)
-        task = next(task_registry.create_task(config))
+        task = task_registry.create_task(config)
         assert isinstance(task, HttpTask), "Task is not an HttpTask"
         assert task.task_id == config.id, "Task ID does not match"
 
     def test_create_file_task(self, task_registry):
         config = FileTaskConfigFactory.build(task_type=TaskType.FILE)
-        task = next(task_registry.create_task(config))
+        task = task_registry.create_task(config)
         assert isinstance(task, FileTask), "Task is not a FileTask"
         assert task.task_id == config.id, "Task ID does not match"
 
@@ -56,15 +56,13 @@ class TestTaskRegistry:
 
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.headers = {"Content-Type": "application/json", "Content-Length": "16"}
         mock_response.text = '{"key": "value"}'
 
         mock_session = mocker.Mock()
         mock_session.request.return_value = mock_response
-        mock_session.__enter__ = mocker.Mock(return_value=mock_session)
-        mock_session.__exit__ = mocker.Mock(return_value=None)
 
-        mocker.patch("requests.Session", return_value=mock_session)
+        mocker.patch("src.task.http._SESSION", mock_session)
 
         context = mocker.Mock()
         context.results = {}
@@ -76,6 +74,67 @@ class TestTaskRegistry:
         assert context.data["url"] == config.url, "URL does not match"
         assert context.data["method"] == config.method, "Method does not match"
 
+    def test_http_task_reuses_session(self, mocker: MockerFixture):
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "0"}
+        mock_response.text = ""
+
+        mock_session = mocker.Mock()
+        mock_session.request.return_value = mock_response
+        mocker.patch("src.task.http._SESSION", mock_session)
+
+        for _ in range(2):
+            config = HttpTaskConfigFactory.build(url="https://example.com", start_time=None)
+            context = mocker.Mock()
+            context.results = {}
+            context.data = {}
+            list(HttpTask(config)._do_execute(context))
+
+        assert mock_session.request.call_count == 2, "Both tasks should go through the shared session"
+
+    def _run_chunked_response(self, mocker: MockerFixture, body: bytes, headers: dict | None = None) -> dict:
+        config = HttpTaskConfigFactory.build(url="https://example.com", start_time=None)
+        task = HttpTask(config)
+
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.headers = headers or {"Transfer-Encoding": "chunked"}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = iter([body])
+        mock_session = mocker.Mock()
+        mock_session.request.return_value = mock_response
+        mocker.patch("src.task.http._SESSION", mock_session)
+
+        context = mocker.Mock()
+        context.results = {}
+        context.data = {}
+        list(task._do_execute(context))
+        return context.results[str(task.task_id)]
+
+    def test_http_task_small_chunked_body_stays_in_memory(self, mocker: MockerFixture):
+        result = self._run_chunked_response(mocker, b"small body")
+
+        assert result["content"] == "small body", "Small chunked body should stay in memory"
+        assert result["content_path"] is None, "Small chunked body should not spill"
+
+    def test_http_task_malformed_content_length_streams(self, mocker: MockerFixture):
+        result = self._run_chunked_response(mocker, b"body", headers={"Content-Length": "not-a-number"})
+
+        assert result["content"] == "body", "Malformed Content-Length should fall back to streaming"
+        assert result["content_path"] is None, "Small streamed body should not spill"
+
+    def test_http_task_large_chunked_body_spills(self, mocker: MockerFixture):
+        from pathlib import Path
+
+        huge_chunk = b"x" * ((1 << 20) + 1)
+        result = self._run_chunked_response(mocker, huge_chunk)
+
+        assert result["content"] == "", "Spilled body should not be buffered in memory"
+        spill_path = Path(result["content_path"])
+        assert spill_path.read_bytes() == huge_chunk, "Spilled content does not match"
+        spill_path.unlink()
+
     def test_file_task_execution(self, mocker: MockerFixture, tmp_path):
         test_file = tmp_path / "test.txt"
 
@@ -85,7 +144,11 @@ class TestTaskRegistry:
         future_time = datetime.now(ZoneInfo("UTC")) + timedelta(hours=1)
 
         config = FileTaskConfigFactory.build(
-            file_path=str(test_file), operation=FileOperation.WRITE, content="Test content", start_time=future_time
+            file_path=str(test_file),
+            operation=FileOperation.WRITE,
+            content="Test content",
+            source_path=None,
+            start_time=future_time,
         )
         task = FileTask(config)
 
@@ -99,6 +162,27 @@ class TestTaskRegistry:
         assert context.data["file_path"] == str(test_file), "File path does not match"
         assert context.data["operation"] == FileOperation.WRITE.value, "Operation does not match"
 
+    def test_file_task_copy_operation(self, tmp_path, mocker: MockerFixture):
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("Copied content")
+        target_file = tmp_path / "target.txt"
+
+        config = FileTaskConfigFactory.build(
+            file_path=str(target_file),
+            operation=FileOperation.WRITE,
+            content=None,
+            source_path=str(source_file),
+            start_time=None,
+        )
+        task = FileTask(config)
+        context = mocker.Mock()
+        context.results = {}
+        context.data = {}
+
+        list(task._do_execute(context))
+
+        assert target_file.read_text() == "Copied content", "File content does not match"
+
     def test_file_task_read_operation(self, tmp_path, mocker: MockerFixture):
         test_file = tmp_path / "test.txt"
         test_content = "Test content"
@@ -119,7 +203,7 @@ class TestTaskRegistry:
 
         list(task._do_execute(context))
 
-        assert context.results[str(task.task_id)] == test_content, "File content does not match"
+        assert bytes(context.results[str(task.task_id)]).decode() == test_content, "File content does not match"
         assert context.data["operation"] == FileOperation.READ.value, "Operation does not match"
 
     def test_file_task_append_operation(self, tmp_path, mocker: MockerFixture):
@@ -140,6 +224,46 @@ class TestTaskRegistry:
         assert test_file.read_text() == initial_content + "Appended content", "File content does not match"
         assert context.data["operation"] == FileOperation.APPEND.value, "Operation does not match"
 
+    def test_append_handle_reuse(self, tmp_path, mocker: MockerFixture):
+        from src.task import file as file_module
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("")
+
+        for content in ("first", "second"):
+            config = FileTaskConfigFactory.build(
+                file_path=str(test_file), operation=FileOperation.APPEND, content=content
+            )
+            context = mocker.Mock()
+            context.results = {}
+            context.data = {}
+            list(FileTask(config)._do_execute(context))
+
+        assert test_file.read_text() == "firstsecond", "Appends should accumulate through the cached handle"
+        assert str(test_file) in file_module._APPEND_HANDLES, "Handle should stay cached between appends"
+
+    def test_append_after_delete_targets_new_file(self, tmp_path, mocker: MockerFixture):
+        from src.task import file as file_module
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("")
+
+        def run(operation: FileOperation, content: str | None = None) -> None:
+            config = FileTaskConfigFactory.build(
+                file_path=str(test_file), operation=operation, content=content, source_path=None, start_time=None
+            )
+            context = mocker.Mock()
+            context.results = {}
+            context.data = {}
+            list(FileTask(config)._do_execute(context))
+
+        run(FileOperation.APPEND, "before")
+        run(FileOperation.DELETE)
+        run(FileOperation.APPEND, "after")
+
+        assert test_file.read_text() == "after", "Append after delete should not write to the orphaned inode"
+        assert str(test_file) in file_module._APPEND_HANDLES, "New handle should be cached after the delete"
+
     def test_task_retry_logic(self, mocker: MockerFixture):
         """Checks if the task retry logic works as expected."""
 